@@ -19,13 +19,13 @@ except NameError:
 if __CLUBS_GYM_SETUP__:
     pass
 else:
-    from . import agent, envs
+    from . import agent, envs, tournament
 
 from typing import Dict
 
 import clubs
 
-__all__ = ["agent", "envs"]
+__all__ = ["agent", "envs", "tournament"]
 ENVS = []
 
 
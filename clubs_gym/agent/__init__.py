@@ -1,4 +1,5 @@
-from . import base, kuhn
+from . import base, best_response, kuhn
 from .base import BaseAgent
+from .best_response import BestResponse
 
-__all__ = ["base", "BaseAgent", "kuhn"]
+__all__ = ["base", "BaseAgent", "best_response", "BestResponse", "kuhn"]
@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 import clubs
 
 
@@ -7,3 +9,56 @@ class BaseAgent:
 
     def act(self, obs: clubs.poker.engine.ObservationDict) -> int:
         raise NotImplementedError()
+
+    def act_batch(self, obs: List[clubs.poker.engine.ObservationDict]) -> List[int]:
+        """Computes bets for a batch of observations, e.g. from multiple
+        tables. Falls back to calling act for every observation, agents
+        which can evaluate observations jointly should override this.
+
+        Parameters
+        ----------
+        obs : List[clubs.poker.engine.ObservationDict]
+            list of observation dictionaries
+
+        Returns
+        -------
+        List[int]
+            one bet for every observation
+        """
+        return [self.act(_obs) for _obs in obs]
+
+    def policy(self, obs: clubs.poker.engine.ObservationDict) -> Dict[int, float]:
+        """Computes the probability of every bet the agent may make for
+        an observation. Falls back to a single bet from act, agents with
+        a stochastic act should override this to expose their full
+        strategy, e.g. for best response computations.
+
+        Parameters
+        ----------
+        obs : clubs.poker.engine.ObservationDict
+            observation dictionary
+
+        Returns
+        -------
+        Dict[int, float]
+            mapping of bets to probabilities
+        """
+        return {self.act(obs): 1.0}
+
+    def policy_batch(
+        self, obs: List[clubs.poker.engine.ObservationDict]
+    ) -> List[Dict[int, float]]:
+        """Computes bet probabilities for a batch of observations. Falls
+        back to calling policy for every observation.
+
+        Parameters
+        ----------
+        obs : List[clubs.poker.engine.ObservationDict]
+            list of observation dictionaries
+
+        Returns
+        -------
+        List[Dict[int, float]]
+            one mapping of bets to probabilities for every observation
+        """
+        return [self.policy(_obs) for _obs in obs]
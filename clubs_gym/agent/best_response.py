@@ -0,0 +1,367 @@
+import copy
+import itertools
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+
+import clubs
+import numpy as np
+
+from clubs_gym import error
+from clubs_gym.agent import base
+
+
+class _Node:
+    def __init__(self, player: int) -> None:
+        # player -1 marks a terminal node
+        self.player = player
+        self.children: List["_Node"] = []
+        # information set index of the acting player for every world
+        self.infosets: Optional["np.ndarray[Any, np.dtype[np.intp]]"] = None
+        # agent probability of every child for every world
+        self.policy: Optional["np.ndarray[Any, np.dtype[np.float64]]"] = None
+        # payoff of every player for every world at terminal nodes
+        self.payoffs: Optional["np.ndarray[Any, np.dtype[np.float64]]"] = None
+
+
+class BestResponse:
+    """Computes exact best responses against and the exploitability of
+    agents for small poker configurations, e.g. Kuhn or Leduc poker.
+    Betting in clubs does not depend on the cards dealt, so the betting
+    tree is walked once with a single dealer. Every possible deal of
+    hole and community cards is a world of equal probability and all
+    card dependent quantities, i.e. agent policies, information sets and
+    payoffs, are stored as arrays over worlds. At every node, agents are
+    queried once per information set with a single call to
+    policy_batch and best responses are computed with vectorized passes
+    over the tree.
+
+    The button is reset to the first seat. In no limit and pot limit
+    games the best response only considers folding, checking, calling
+    and the minimum and maximum raise, so it is a lower bound for the
+    true best response.
+
+    Parameters
+    ----------
+    config : clubs.configs.PokerConfig
+        clubs config of the game
+    agents : Union[base.BaseAgent, List[base.BaseAgent]]
+        a single agent used for all players or a list of agents, one
+        for each player
+
+    Examples
+    --------
+
+        >>> best_response = BestResponse(
+        ...     clubs.configs.KUHN_TWO_PLAYER, kuhn.NashKuhnAgent(0.2)
+        ... )
+        >>> best_response.exploitability()
+        ... 0.0
+    """
+
+    def __init__(
+        self,
+        config: clubs.configs.PokerConfig,
+        agents: Union[base.BaseAgent, List[base.BaseAgent]],
+    ) -> None:
+        num_players = config["num_players"]
+        if isinstance(agents, base.BaseAgent):
+            agents = [agents] * num_players
+        error_msg = "invalid agent configuration, got {}, expected {}"
+        if len(agents) != num_players:
+            raise error.InvalidAgentConfigurationError(
+                error_msg.format(
+                    f"{len(agents)} number of agents",
+                    f"{num_players} number of agents",
+                )
+            )
+        if not all(isinstance(_agent, base.BaseAgent) for _agent in agents):
+            raise error.InvalidAgentConfigurationError(
+                error_msg.format(
+                    f"agent types {[type(_agent) for _agent in agents]}",
+                    "only subtypes of clubs.agent.BaseAgent",
+                )
+            )
+
+        self.num_players: int = num_players
+        self.agents = list(agents)
+        self.dealer = clubs.Dealer(**config)
+
+        self.deals = self._deals()
+        self.num_worlds = len(self.deals)
+        self._cards = np.array(
+            [[int(card) for card in deal] for deal in self.deals], dtype=np.int64
+        )
+        self._infoset_cache: Dict[
+            Tuple[int, int], "np.ndarray[Any, np.dtype[np.intp]]"
+        ] = {}
+        self._strengths = self._hand_strengths()
+
+        self.dealer.reset(reset_button=True, reset_stacks=True)
+        self.root = self._build(self.dealer)
+
+    def policy_values(self) -> List[float]:
+        """Expected payoffs of every player when all players follow
+        their agents.
+
+        Returns
+        -------
+        List[float]
+            expected payoff for every player
+        """
+        values = self._policy_values(self.root)
+        return [float(value) for value in values.mean(axis=0)]
+
+    def best_response_value(self, player: int) -> float:
+        """Expected payoff of a best response for a player while all
+        other players follow their agents.
+
+        Parameters
+        ----------
+        player : int
+            seat of the best responding player
+
+        Returns
+        -------
+        float
+            expected payoff of the best response
+        """
+        reach = np.ones(self.num_worlds)
+        values = self._best_response_values(self.root, player, reach)
+        return float(values.mean())
+
+    def nash_conv(self) -> float:
+        """Sum of the gains every player can make by deviating to a best
+        response.
+
+        Returns
+        -------
+        float
+            nash conv of the agents
+        """
+        policy_values = self.policy_values()
+        return sum(
+            self.best_response_value(player) - policy_values[player]
+            for player in range(self.num_players)
+        )
+
+    def exploitability(self) -> float:
+        """Average gain of a best response over all players. In two
+        player games this is the expected payoff per hand of a best
+        response playing both positions against the agents.
+
+        Returns
+        -------
+        float
+            exploitability of the agents
+        """
+        return self.nash_conv() / self.num_players
+
+    def _deals(self) -> List[List[clubs.poker.Card]]:
+        # cards are drawn in the order: preflop community cards, hole
+        # cards for every player, community cards for every later street
+        num_community_cards = self.dealer.num_community_cards
+        slots = (
+            num_community_cards[:1]
+            + [self.dealer.num_hole_cards] * self.num_players
+            + num_community_cards[1:]
+        )
+        deals: List[List[clubs.poker.Card]] = [[]]
+        for slot in slots:
+            deals = [
+                deal + list(cards)
+                for deal in deals
+                for cards in itertools.combinations(
+                    [card for card in self.dealer.deck.full_deck if card not in deal],
+                    slot,
+                )
+            ]
+        return deals
+
+    def _columns(self, player: int, num_community_cards: int) -> List[int]:
+        # deal columns holding the hole cards of a player and the first
+        # num_community_cards community cards
+        num_preflop = self.dealer.num_community_cards[0]
+        num_hole_cards = self.dealer.num_hole_cards
+        hole_start = num_preflop + player * num_hole_cards
+        community_start = num_preflop + self.num_players * num_hole_cards
+        return (
+            list(range(hole_start, hole_start + num_hole_cards))
+            + list(range(min(num_preflop, num_community_cards)))
+            + list(
+                range(
+                    community_start,
+                    community_start + max(0, num_community_cards - num_preflop),
+                )
+            )
+        )
+
+    def _split(
+        self, world: int, player: int, num_community_cards: int
+    ) -> Tuple[List[clubs.poker.Card], List[clubs.poker.Card]]:
+        num_hole_cards = self.dealer.num_hole_cards
+        cards = [
+            self.deals[world][column]
+            for column in self._columns(player, num_community_cards)
+        ]
+        return cards[:num_hole_cards], cards[num_hole_cards:]
+
+    def _infosets(
+        self, player: int, num_community_cards: int
+    ) -> "np.ndarray[Any, np.dtype[np.intp]]":
+        key = (player, num_community_cards)
+        if key not in self._infoset_cache:
+            columns = self._columns(player, num_community_cards)
+            _, infosets = np.unique(
+                self._cards[:, columns], axis=0, return_inverse=True
+            )
+            self._infoset_cache[key] = infosets.reshape(-1)
+        return self._infoset_cache[key]
+
+    def _hand_strengths(self) -> "np.ndarray[Any, np.dtype[np.int64]]":
+        num_community_cards = sum(self.dealer.num_community_cards)
+        strengths = np.zeros((self.num_worlds, self.num_players), dtype=np.int64)
+        for world in range(self.num_worlds):
+            for player in range(self.num_players):
+                strengths[world, player] = self.dealer.evaluator.evaluate(
+                    *self._split(world, player, num_community_cards)
+                )
+        return strengths
+
+    @staticmethod
+    def _clone(dealer: clubs.Dealer) -> clubs.Dealer:
+        # copy everything the dealer mutates in place while stepping
+        dealer = copy.copy(dealer)
+        for attr in (
+            "active",
+            "community_cards",
+            "history",
+            "pot_commits",
+            "stacks",
+            "street_commits",
+            "street_option",
+        ):
+            setattr(dealer, attr, list(getattr(dealer, attr)))
+        dealer.deck = copy.copy(dealer.deck)
+        dealer.deck.cards = list(dealer.deck.cards)
+        return dealer
+
+    def _build(self, dealer: clubs.Dealer) -> _Node:
+        player = dealer.action
+        num_community_cards = len(dealer.community_cards)
+        obs = dealer._observation(False)
+        call, min_raise, max_raise = obs["call"], obs["min_raise"], obs["max_raise"]
+
+        infosets = self._infosets(player, num_community_cards)
+        _, worlds = np.unique(infosets, return_index=True)
+        observations = []
+        for world in worlds:
+            hole_cards, community_cards = self._split(
+                world, player, num_community_cards
+            )
+            observations.append(
+                {**obs, "hole_cards": hole_cards, "community_cards": community_cards}
+            )
+        policies = self.agents[player].policy_batch(observations)
+
+        # bets are rounded to a valid bet size like in dealer.step
+        infoset_policies: List[Dict[int, float]] = []
+        for policy in policies:
+            infoset_policy: Dict[int, float] = {}
+            for bet, probability in policy.items():
+                bet = clubs.Dealer._clean_bet(
+                    max(0, round(bet)), call, min_raise, max_raise
+                )
+                infoset_policy[bet] = infoset_policy.get(bet, 0) + probability
+            infoset_policies.append(infoset_policy)
+        bets = sorted({0, call, min_raise, max_raise}.union(*infoset_policies))
+
+        node = _Node(player)
+        node.infosets = infosets
+        node.policy = np.array(
+            [
+                [infoset_policy.get(bet, 0) for bet in bets]
+                for infoset_policy in infoset_policies
+            ]
+        )[infosets]
+        for bet in bets:
+            child = self._clone(dealer)
+            _, _, done = child.step(bet)
+            if all(done):
+                node.children.append(self._terminal(child))
+            else:
+                node.children.append(self._build(child))
+        return node
+
+    def _terminal(self, dealer: clubs.Dealer) -> _Node:
+        node = _Node(-1)
+        # step clears the pot once the hand is done
+        dealer.pot = sum(dealer.pot_commits)
+        if sum(dealer.active) == 1:
+            node.payoffs = np.tile(dealer._payouts(), (self.num_worlds, 1))
+            return node
+        # showdown payouts only depend on the hand strengths of active
+        # players, so they are computed once for every distinct ranking
+        active = np.array(dealer.active, dtype=bool)
+        _, worlds, inverse = np.unique(
+            self._strengths[:, active], axis=0, return_index=True, return_inverse=True
+        )
+        num_community_cards = sum(self.dealer.num_community_cards)
+        payoffs = []
+        for world in worlds:
+            dealer.hole_cards = [
+                self._split(world, player, 0)[0] for player in range(self.num_players)
+            ]
+            dealer.community_cards = self._split(world, 0, num_community_cards)[1]
+            payoffs.append(dealer._payouts())
+        node.payoffs = np.array(payoffs, dtype=float)[inverse.reshape(-1)]
+        return node
+
+    def _policy_values(self, node: _Node) -> "np.ndarray[Any, np.dtype[np.float64]]":
+        if node.payoffs is not None:
+            return node.payoffs
+        assert node.policy is not None
+        values = np.zeros((self.num_worlds, self.num_players))
+        for action, child in enumerate(node.children):
+            probabilities = node.policy[:, action]
+            if probabilities.any():
+                values += probabilities[:, None] * self._policy_values(child)
+        return values
+
+    def _best_response_values(
+        self, node: _Node, player: int, reach: "np.ndarray[Any, np.dtype[np.float64]]"
+    ) -> "np.ndarray[Any, np.dtype[np.float64]]":
+        if node.payoffs is not None:
+            return node.payoffs[:, player]
+        # worlds that are never reached do not contribute to the value
+        if not reach.any():
+            return np.zeros(self.num_worlds)
+        assert node.policy is not None and node.infosets is not None
+        if node.player != player:
+            values = np.zeros(self.num_worlds)
+            for action, child in enumerate(node.children):
+                probabilities = node.policy[:, action]
+                values += probabilities * self._best_response_values(
+                    child, player, reach * probabilities
+                )
+            return values
+        # pick the action with the highest reach weighted value in every
+        # information set of the best responding player
+        child_values = np.stack(
+            [
+                self._best_response_values(child, player, reach)
+                for child in node.children
+            ]
+        )
+        num_infosets = node.infosets.max() + 1
+        infoset_values = np.stack(
+            [
+                np.bincount(
+                    node.infosets, weights=reach * values, minlength=num_infosets
+                )
+                for values in child_values
+            ]
+        )
+        actions = infoset_values.argmax(axis=0)[node.infosets]
+        return cast(
+            "np.ndarray[Any, np.dtype[np.float64]]",
+            child_values[actions, np.arange(self.num_worlds)],
+        )
@@ -1,4 +1,5 @@
 import random
+from typing import Dict
 
 import clubs
 
@@ -14,67 +15,57 @@ class NashKuhnAgent(base.BaseAgent):
             )
         self.alpha = alpha
 
-    def player_1_check(self, obs: clubs.poker.engine.ObservationDict) -> int:
+    @staticmethod
+    def _rank_probability(
+        obs: clubs.poker.engine.ObservationDict, probabilities: Dict[str, float]
+    ) -> float:
         rank = obs["hole_cards"][0].rank
-        if rank == "Q":
-            if random.random() < self.alpha:
-                return 1
-            return 0
-        if rank == "K":
-            return 0
-        if rank == "A":
-            if random.random() < 3 * self.alpha:
-                return 1
-            return 0
-        raise ValueError("got invalid card rank, expected one of [Q, K, A] got {f.}")
+        if rank not in probabilities:
+            raise ValueError(
+                f"got invalid card rank, expected one of [Q, K, A] got {rank}"
+            )
+        return probabilities[rank]
 
-    def player_1_bet(self, obs: clubs.poker.engine.ObservationDict) -> int:
-        rank = obs["hole_cards"][0].rank
-        if rank == "Q":
-            return 0
-        if rank == "K":
-            if random.random() < 1 / 3 + self.alpha:
-                return 1
-            return 0
-        if rank == "A":
-            return 1
-        raise ValueError("got invalid card rank, expected one of [Q, K, A] got {f.}")
+    def _player_1_check_probability(
+        self, obs: clubs.poker.engine.ObservationDict
+    ) -> float:
+        return self._rank_probability(
+            obs, {"Q": self.alpha, "K": 0, "A": 3 * self.alpha}
+        )
 
-    def _player_1(self, obs: clubs.poker.engine.ObservationDict) -> int:
-        if obs["pot"] == 2:
-            return self.player_1_check(obs)
-        return self.player_1_bet(obs)
+    def _player_1_bet_probability(
+        self, obs: clubs.poker.engine.ObservationDict
+    ) -> float:
+        return self._rank_probability(obs, {"Q": 0, "K": 1 / 3 + self.alpha, "A": 1})
 
-    def _player_2_check(self, obs: clubs.poker.engine.ObservationDict) -> int:
-        rank = obs["hole_cards"][0].rank
-        if rank == "Q":
-            if random.random() < 1 / 3:
-                return 1
-            return 0
-        if rank == "K":
-            return 0
-        if rank == "A":
-            return 1
-        raise ValueError("got invalid card rank, expected one of [Q, K, A] got {f.}")
+    def _player_2_check_probability(
+        self, obs: clubs.poker.engine.ObservationDict
+    ) -> float:
+        return self._rank_probability(obs, {"Q": 1 / 3, "K": 0, "A": 1})
 
-    def _player_2_bet(self, obs: clubs.poker.engine.ObservationDict) -> int:
-        rank = obs["hole_cards"][0].rank
-        if rank == "Q":
-            return 0
-        if rank == "K":
-            if random.random() < 1 / 3:
-                return 1
-            return 0
-        if rank == "A":
-            return 1
-        raise ValueError("got invalid card rank, expected one of [Q, K, A] got {f.}")
+    def _player_2_bet_probability(
+        self, obs: clubs.poker.engine.ObservationDict
+    ) -> float:
+        return self._rank_probability(obs, {"Q": 0, "K": 1 / 3, "A": 1})
 
-    def _player_2(self, obs: clubs.poker.engine.ObservationDict) -> int:
+    def _bet_probability(self, obs: clubs.poker.engine.ObservationDict) -> float:
+        if obs["action"] == 0:
+            if obs["pot"] == 2:
+                return self._player_1_check_probability(obs)
+            return self._player_1_bet_probability(obs)
         if obs["pot"] == 2:
-            return self._player_2_check(obs)
-        return self._player_2_bet(obs)
+            return self._player_2_check_probability(obs)
+        return self._player_2_bet_probability(obs)
+
+    def player_1_check(self, obs: clubs.poker.engine.ObservationDict) -> int:
+        return int(random.random() < self._player_1_check_probability(obs))
+
+    def player_1_bet(self, obs: clubs.poker.engine.ObservationDict) -> int:
+        return int(random.random() < self._player_1_bet_probability(obs))
+
+    def policy(self, obs: clubs.poker.engine.ObservationDict) -> Dict[int, float]:
+        bet_probability = self._bet_probability(obs)
+        return {0: 1 - bet_probability, 1: bet_probability}
 
     def act(self, obs: clubs.poker.engine.ObservationDict) -> int:
-        if obs["action"] == 0:
-            return self._player_1(obs)
-        return self._player_2(obs)
+        return int(random.random() < self._bet_probability(obs))
@@ -8,3 +8,11 @@ class EnvironmentResetError(Exception):
 
 class NoRegisteredAgentsError(Exception):
     pass
+
+
+class InvalidTournamentConfigurationError(Exception):
+    pass
+
+
+class TournamentResetError(Exception):
+    pass
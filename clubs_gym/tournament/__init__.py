@@ -0,0 +1,3 @@
+from .tournament import BlindLevel, LevelStats, Tournament
+
+__all__ = ["BlindLevel", "LevelStats", "Tournament"]
@@ -0,0 +1,434 @@
+import copy
+import operator
+import random
+import sys
+from timeit import default_timer as timer
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+if sys.version_info >= (3, 8):
+    from typing import TypedDict
+else:
+    from typing_extensions import TypedDict
+
+import clubs
+
+from clubs_gym import agent, error
+
+
+class BlindLevel(NamedTuple):
+    small_blind: int
+    big_blind: int
+    ante: int = 0
+
+
+class LevelStats(TypedDict):
+    level: int
+    small_blind: int
+    big_blind: int
+    ante: int
+    rounds: int
+    hands: int
+    actions: int
+    seconds: float
+    players: int
+    tables: int
+
+
+class _TableDealer(clubs.Dealer):  # type: ignore
+    """Dealer for a single tournament table. The number of seats,
+    stacks, button and blinds are set from the tournament before
+    every hand, so one dealer can be reused while players bust and
+    move between tables."""
+
+    def clone(self) -> "_TableDealer":
+        # the evaluator lookup table is by far the largest part of a
+        # dealer and is read only, so it is shared between all tables
+        dealer = copy.copy(self)
+        dealer.deck = copy.copy(self.deck)
+        dealer.viewer = None
+        return dealer
+
+    def seat(
+        self, stacks: List[int], button: int, level: BlindLevel
+    ) -> clubs.poker.engine.ObservationDict:
+        num_players = len(stacks)
+        self.num_players = num_players
+        self.blinds = [level.small_blind, level.big_blind] + [0] * (num_players - 2)
+        self.antes = [level.ante] * num_players
+        self.big_blind = level.big_blind
+        self.stacks = stacks
+        # reset moves the button on by one seat
+        self.button = button % num_players
+        return self.reset()
+
+    def _collect_multiple_bets(
+        self, bets: List[int], street_commits: bool = True
+    ) -> None:
+        # clubs collects full blinds and antes, so short stacks would go
+        # negative. cap every bet at the stack of the seat posting it,
+        # bets are rotated to start at the player in action
+        bets = [
+            min(bet, self.stacks[(idx + self.action) % self.num_players])
+            for idx, bet in enumerate(bets)
+        ]
+        super()._collect_multiple_bets(bets, street_commits)
+
+    def _all_agreed(self) -> bool:
+        # only players with chips behind need to act, otherwise the hand
+        # ends without a showdown once all remaining players are all in
+        max_commit = max(self.street_commits)
+        return all(
+            option and street_commit == max_commit
+            for active, stack, option, street_commit in zip(
+                self.active, self.stacks, self.street_option, self.street_commits
+            )
+            if active and stack
+        )
+
+    def _eval_round(self) -> List[int]:
+        # mirrors clubs.Dealer._eval_round, but hands odd chips to the
+        # first winning player left of the button. the original lookup
+        # runs past the last seat if the button is not on seat 0
+        hand_strengths = self._eval_hands(self.hole_cards, self.community_cards)
+        hands: List[List[int]] = [
+            [player_idx, hand_strength, self.pot_commits[player_idx]]
+            for player_idx, hand_strength in enumerate(hand_strengths)
+        ]
+        hands = sorted(hands, key=operator.itemgetter(1, 2))
+        pot = self.pot
+        remainder = 0
+        payouts = [0] * self.num_players
+        worst_hand = self.evaluator.table.max_rank + 1
+        for hand_idx, (_, strength, pot_commit) in enumerate(hands):
+            eligible = [
+                player_idx
+                for player_idx, other_strength, _ in hands
+                if other_strength == strength
+            ]
+            cut = [min(hand[2], pot_commit) for hand in hands]
+            split_pot = sum(cut)
+            if not split_pot:
+                continue
+            split = split_pot // len(eligible)
+            remainder += split_pot % len(eligible)
+            for player_idx in eligible:
+                payouts[player_idx] += split
+            for idx in range(len(cut)):
+                hands[idx][2] -= cut[idx]
+            pot -= split_pot
+            hands[hand_idx][1] = worst_hand
+            if pot == 0:
+                break
+        if remainder:
+            for offset in range(1, self.num_players + 1):
+                player_idx = (self.button + offset) % self.num_players
+                if payouts[player_idx]:
+                    payouts[player_idx] += remainder
+                    break
+        return payouts
+
+
+class _Table:
+    def __init__(self, dealer: _TableDealer, players: List[int]) -> None:
+        self.dealer = dealer
+        self.players = players
+        # seat of the previous button, the next hand starts one further
+        self.button = -1
+
+    def remove(self, seat: int) -> int:
+        # keep the button on the same players when seats are vacated
+        if seat <= self.button:
+            self.button -= 1
+        return self.players.pop(seat)
+
+
+class Tournament:
+    """Runs a multi table tournament (or a sit and go if all players
+    fit at a single table) on a pool of clubs dealers. Every step
+    deals one hand at every table, all tables are played concurrently
+    and pending decisions are passed to agents in batches using
+    act_batch. After each hand, busted players are eliminated, tables
+    are broken when the remaining players fit on fewer tables and
+    players are moved so table sizes differ by at most one.
+
+    Parameters
+    ----------
+    config : clubs.configs.PokerConfig
+        clubs config of a single table, num_players sets the number of
+        seats per table. blinds and antes are replaced by the blind
+        schedule
+    num_players : int
+        number of players entering the tournament
+    agents : Union[agent.BaseAgent, List[agent.BaseAgent]]
+        a single agent used for all players or a list of agents, one
+        for each player
+    blind_schedule : Sequence[Union[BlindLevel, Tuple[int, ...]]]
+        blind levels as (small_blind, big_blind[, ante]), the last
+        level is kept once the schedule is exhausted
+    hands_per_level : int
+        number of rounds, i.e. hands dealt at every table, per level
+    start_stack : Optional[int], optional
+        number of chips each player starts with, by default the start
+        stack of the config
+
+    Examples
+    --------
+
+        >>> class PushFoldAgent(agent.BaseAgent):
+        ...     def act(self, obs):
+        ...         if random.random() < 0.5:
+        ...             return obs["max_raise"] or obs["call"]
+        ...         return 0
+        >>> tournament = Tournament(
+        ...     clubs.configs.NO_LIMIT_HOLDEM_NINE_PLAYER,
+        ...     num_players=1000,
+        ...     agents=PushFoldAgent(),
+        ...     blind_schedule=[(1, 2), (2, 4), (5, 10, 1), (10, 20, 2)],
+        ...     hands_per_level=10,
+        ... )
+        >>> standings = tournament.run()
+    """
+
+    def __init__(
+        self,
+        config: clubs.configs.PokerConfig,
+        num_players: int,
+        agents: Union[agent.BaseAgent, List[agent.BaseAgent]],
+        blind_schedule: Sequence[Union[BlindLevel, Tuple[int, ...]]],
+        hands_per_level: int,
+        start_stack: Optional[int] = None,
+    ) -> None:
+        error_msg = "invalid tournament configuration, got {}, expected {}"
+        if num_players < 2:
+            raise error.InvalidTournamentConfigurationError(
+                error_msg.format(f"{num_players} players", "at least 2 players")
+            )
+        if config["num_players"] < 2:
+            raise error.InvalidTournamentConfigurationError(
+                error_msg.format(
+                    f"{config['num_players']} seats per table",
+                    "at least 2 seats per table",
+                )
+            )
+        if not blind_schedule:
+            raise error.InvalidTournamentConfigurationError(
+                error_msg.format("empty blind schedule", "at least one blind level")
+            )
+        if hands_per_level < 1:
+            raise error.InvalidTournamentConfigurationError(
+                error_msg.format(
+                    f"{hands_per_level} hands per level", "at least 1 hand per level"
+                )
+            )
+        if isinstance(agents, agent.BaseAgent):
+            agents = [agents] * num_players
+        if len(agents) != num_players:
+            raise error.InvalidTournamentConfigurationError(
+                error_msg.format(
+                    f"{len(agents)} number of agents",
+                    f"{num_players} number of agents",
+                )
+            )
+        if not all(isinstance(_agent, agent.BaseAgent) for _agent in agents):
+            raise error.InvalidTournamentConfigurationError(
+                error_msg.format(
+                    f"agent types {set(type(_agent) for _agent in agents)}",
+                    "only subtypes of clubs.agent.BaseAgent",
+                )
+            )
+
+        self.num_players = num_players
+        self.agents = list(agents)
+        self.blind_schedule = [BlindLevel(*level) for level in blind_schedule]
+        self.hands_per_level = hands_per_level
+        self.num_seats = config["num_players"]
+        self.start_stack = config["start_stack"] if start_stack is None else start_stack
+
+        self._template = _TableDealer(**config)
+        self._pool: List[_TableDealer] = []
+
+        self.level = 0
+        self.rounds = 0
+        self.stacks: List[int] = []
+        self.tables: List[_Table] = []
+        self.eliminated: List[int] = []
+        self.level_stats: List[LevelStats] = []
+
+    @property
+    def num_remaining(self) -> int:
+        return self.num_players - len(self.eliminated)
+
+    @property
+    def done(self) -> bool:
+        return bool(self.stacks) and self.num_remaining <= 1
+
+    def standings(self) -> List[int]:
+        """Player ids ordered by finishing position, starting with the
+        winner. Players still in the tournament are ranked by stack
+        size.
+
+        Returns
+        -------
+        List[int]
+            player ids
+        """
+        remaining = [player for table in self.tables for player in table.players]
+        remaining = sorted(remaining, key=lambda player: -self.stacks[player])
+        return remaining + self.eliminated[::-1]
+
+    def reset(self) -> None:
+        """Resets the tournament. Resets all stacks, seats players at
+        random and starts at the first blind level."""
+        for table in self.tables:
+            self._pool.append(table.dealer)
+        players = list(range(self.num_players))
+        random.shuffle(players)
+        num_tables = -(-self.num_players // self.num_seats)
+        self.tables = [
+            _Table(self._dealer(), players[table_idx::num_tables])
+            for table_idx in range(num_tables)
+        ]
+        self.stacks = [self.start_stack] * self.num_players
+        self.eliminated = []
+        self.level = 0
+        self.rounds = 0
+        self.level_stats = [self._new_level_stats()]
+
+    def step(self) -> bool:
+        """Deals one hand at every table and plays all hands to the
+        end, then eliminates busted players and breaks and balances
+        tables.
+
+        Returns
+        -------
+        bool
+            whether the tournament is finished
+        """
+        if not self.stacks:
+            raise error.TournamentResetError("call reset() before calling first step()")
+        if self.done:
+            raise error.TournamentResetError(
+                "tournament is finished, call reset() to start a new tournament"
+            )
+        start = timer()
+        start_stacks = list(self.stacks)
+        hands, actions = self._play_round()
+        self._eliminate(start_stacks)
+        self._break_tables()
+        self._balance_tables()
+        self.rounds += 1
+
+        stats = self.level_stats[-1]
+        stats["rounds"] += 1
+        stats["hands"] += hands
+        stats["actions"] += actions
+        stats["seconds"] += timer() - start
+        stats["players"] = self.num_remaining
+        stats["tables"] = len(self.tables)
+
+        if self.done:
+            return True
+        if (
+            not self.rounds % self.hands_per_level
+            and self.level < len(self.blind_schedule) - 1
+        ):
+            self.level += 1
+            self.level_stats.append(self._new_level_stats())
+        return False
+
+    def run(self) -> List[int]:
+        """Resets the tournament and plays until one player is left.
+
+        Returns
+        -------
+        List[int]
+            player ids ordered by finishing position
+        """
+        self.reset()
+        while not self.step():
+            pass
+        return self.standings()
+
+    def _dealer(self) -> _TableDealer:
+        if self._pool:
+            return self._pool.pop()
+        return self._template.clone()
+
+    def _new_level_stats(self) -> LevelStats:
+        level = self.blind_schedule[self.level]
+        return {
+            "level": self.level,
+            "small_blind": level.small_blind,
+            "big_blind": level.big_blind,
+            "ante": level.ante,
+            "rounds": 0,
+            "hands": 0,
+            "actions": 0,
+            "seconds": 0.0,
+            "players": self.num_remaining,
+            "tables": len(self.tables),
+        }
+
+    def _play_round(self) -> Tuple[int, int]:
+        level = self.blind_schedule[self.level]
+        pending: Dict[int, clubs.poker.engine.ObservationDict] = {}
+        for table_idx, table in enumerate(self.tables):
+            # a lone player at a short handed table sits out until moved
+            if len(table.players) < 2:
+                continue
+            stacks = [self.stacks[player] for player in table.players]
+            pending[table_idx] = table.dealer.seat(stacks, table.button, level)
+        hands = len(pending)
+        actions = 0
+        while pending:
+            batches: Dict[int, Tuple[agent.BaseAgent, List[int]]] = {}
+            for table_idx, obs in pending.items():
+                player = self.tables[table_idx].players[obs["action"]]
+                _agent = self.agents[player]
+                batches.setdefault(id(_agent), (_agent, []))[1].append(table_idx)
+            for _agent, table_idcs in batches.values():
+                bets = _agent.act_batch([pending[idx] for idx in table_idcs])
+                for table_idx, bet in zip(table_idcs, bets):
+                    table = self.tables[table_idx]
+                    obs, _, done = table.dealer.step(bet)
+                    actions += 1
+                    if not all(done):
+                        pending[table_idx] = obs
+                        continue
+                    del pending[table_idx]
+                    table.button = table.dealer.button
+                    for player, stack in zip(table.players, table.dealer.stacks):
+                        self.stacks[player] = stack
+        return hands, actions
+
+    def _eliminate(self, start_stacks: List[int]) -> None:
+        busted: List[Tuple[int, int]] = []
+        for table in self.tables:
+            for seat in reversed(range(len(table.players))):
+                if not self.stacks[table.players[seat]]:
+                    player = table.remove(seat)
+                    busted.append((start_stacks[player], player))
+        # players busting in the same round are ranked by the stack
+        # they started the hand with
+        busted = sorted(busted, key=lambda bust: bust[0])
+        self.eliminated.extend(player for _, player in busted)
+
+    def _break_tables(self) -> None:
+        num_tables = max(1, -(-self.num_remaining // self.num_seats))
+        while len(self.tables) > num_tables:
+            table = min(self.tables, key=lambda table: len(table.players))
+            self.tables.remove(table)
+            self._pool.append(table.dealer)
+            for player in table.players:
+                target = min(self.tables, key=lambda table: len(table.players))
+                target.players.append(player)
+
+    def _balance_tables(self) -> None:
+        while True:
+            smallest = min(self.tables, key=lambda table: len(table.players))
+            largest = max(self.tables, key=lambda table: len(table.players))
+            if len(largest.players) - len(smallest.players) <= 1:
+                break
+            # move the player due to post the next big blind
+            seat = (largest.button + 3) % len(largest.players)
+            smallest.players.append(largest.remove(seat))
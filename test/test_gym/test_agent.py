@@ -76,3 +76,57 @@ def test_agent() -> None:
 
     obs["hole_cards"] = [clubs.Card("AS")]
     assert agent.act(obs) == 1
+
+
+def test_act_batch() -> None:
+    agent = clubs_gym.agent.kuhn.NashKuhnAgent(0)
+
+    obs = {
+        "action": 0,
+        "active": [True, True],
+        "button": 1,
+        "call": 0,
+        "community_cards": [],
+        "hole_cards": [clubs.Card("QS")],
+        "max_raise": 1,
+        "min_raise": 1,
+        "pot": 4,
+        "stacks": [9, 9],
+        "street_commits": [0, 0],
+    }
+    obs_batch = [
+        {**obs, "hole_cards": [clubs.Card(card)]} for card in ["QS", "AS", "AH"]
+    ]
+    assert agent.act_batch(obs_batch) == [0, 1, 1]
+
+
+def test_policy() -> None:
+    agent = clubs_gym.agent.kuhn.NashKuhnAgent(0.2)
+
+    obs = {
+        "action": 0,
+        "active": [True, True],
+        "button": 1,
+        "call": 0,
+        "community_cards": [],
+        "hole_cards": [clubs.Card("AS")],
+        "max_raise": 1,
+        "min_raise": 1,
+        "pot": 2,
+        "stacks": [9, 9],
+        "street_commits": [0, 0],
+    }
+    assert agent.policy(obs) == pytest.approx({0: 0.4, 1: 0.6})
+
+    obs["action"] = 1
+    obs["pot"] = 3
+    obs["hole_cards"] = [clubs.Card("KS")]
+    assert agent.policy_batch([obs]) == [pytest.approx({0: 2 / 3, 1: 1 / 3})]
+
+    obs["hole_cards"] = [clubs.Card("JS")]
+    with pytest.raises(ValueError):
+        agent.act(obs)
+
+    base_agent = clubs_gym.agent.BaseAgent()
+    with pytest.raises(NotImplementedError):
+        base_agent.policy(obs)
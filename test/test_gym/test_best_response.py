@@ -0,0 +1,90 @@
+from typing import Dict, List
+
+import clubs
+import numpy as np
+import pytest
+
+import clubs_gym
+from clubs_gym import error
+
+
+class CallAgent(clubs_gym.agent.BaseAgent):
+    def act(self, obs: clubs.poker.engine.ObservationDict) -> int:
+        return int(obs["call"])
+
+
+class UniformAgent(clubs_gym.agent.BaseAgent):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_sizes: List[int] = []
+
+    def policy(self, obs: clubs.poker.engine.ObservationDict) -> Dict[int, float]:
+        bets = {0, obs["call"], obs["min_raise"], obs["max_raise"]}
+        return {bet: 1 / len(bets) for bet in bets}
+
+    def policy_batch(
+        self, obs: List[clubs.poker.engine.ObservationDict]
+    ) -> List[Dict[int, float]]:
+        self.batch_sizes.append(len(obs))
+        return super().policy_batch(obs)
+
+
+def test_nash_kuhn() -> None:
+    for alpha in np.linspace(0, 1 / 3, 7):
+        best_response = clubs_gym.agent.BestResponse(
+            clubs.configs.KUHN_TWO_PLAYER, clubs_gym.agent.kuhn.NashKuhnAgent(alpha)
+        )
+        assert best_response.policy_values() == pytest.approx([-1 / 18, 1 / 18])
+        assert best_response.best_response_value(0) == pytest.approx(-1 / 18)
+        assert best_response.best_response_value(1) == pytest.approx(1 / 18)
+        assert abs(best_response.exploitability()) < 1e-9
+
+
+def test_kuhn() -> None:
+    best_response = clubs_gym.agent.BestResponse(
+        clubs.configs.KUHN_TWO_PLAYER, CallAgent()
+    )
+    assert best_response.num_worlds == 6
+    assert best_response.policy_values() == pytest.approx([0, 0])
+    assert best_response.exploitability() == pytest.approx(1 / 3)
+
+
+def test_leduc() -> None:
+    agent = UniformAgent()
+    best_response = clubs_gym.agent.BestResponse(
+        clubs.configs.LEDUC_TWO_PLAYER, [agent, CallAgent()]
+    )
+    assert best_response.num_worlds == 120
+    # one batch per decision node of player 0 in build order, holding
+    # one observation per information set: 6 hole cards preflop and
+    # 6 * 5 hole and community card combinations on the flop
+    nodes = [best_response.root]
+    infoset_counts = []
+    while nodes:
+        node = nodes.pop()
+        if node.player == 0:
+            assert node.infosets is not None
+            infoset_counts.append(len(np.unique(node.infosets)))
+        nodes.extend(reversed(node.children))
+    # player 0 acts at 3 preflop nodes and 3 flop nodes for each of the
+    # 5 preflop lines reaching the flop
+    assert len(agent.batch_sizes) == 18
+    assert agent.batch_sizes == infoset_counts
+    assert sorted(agent.batch_sizes) == [6] * 3 + [30] * 15
+
+    policy_values = best_response.policy_values()
+    assert sum(policy_values) == pytest.approx(0)
+    for player in range(2):
+        assert best_response.best_response_value(player) > policy_values[player]
+    assert best_response.exploitability() > 0
+
+
+def test_errors() -> None:
+    agent = clubs_gym.agent.kuhn.NashKuhnAgent(0)
+    with pytest.raises(error.InvalidAgentConfigurationError):
+        clubs_gym.agent.BestResponse(clubs.configs.KUHN_TWO_PLAYER, [agent])
+
+    with pytest.raises(error.InvalidAgentConfigurationError):
+        clubs_gym.agent.BestResponse(
+            clubs.configs.KUHN_TWO_PLAYER, [agent, None]  # type: ignore
+        )
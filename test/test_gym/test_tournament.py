@@ -0,0 +1,150 @@
+import random
+
+import clubs
+import pytest
+
+import clubs_gym
+from clubs_gym import error
+
+
+class PushFoldAgent(clubs_gym.agent.BaseAgent):
+    def act(self, obs: clubs.poker.engine.ObservationDict) -> int:
+        if random.random() < 0.5:
+            return int(obs["max_raise"] or obs["call"])
+        return 0
+
+
+def test_tournament() -> None:
+    random.seed(0)
+    config = clubs.configs.NO_LIMIT_HOLDEM_NINE_PLAYER
+    tournament = clubs_gym.tournament.Tournament(
+        config,
+        num_players=10000,
+        agents=PushFoldAgent(),
+        blind_schedule=[(1, 2), (2, 4, 1), (5, 10, 1), (10, 20, 2)],
+        hands_per_level=5,
+    )
+    tournament.reset()
+    assert len(tournament.tables) == 1112
+
+    standings = tournament.run()
+    assert sorted(standings) == list(range(10000))
+    assert tournament.done
+    assert tournament.stacks[standings[0]] == 10000 * config["start_stack"]
+    assert sum(tournament.stacks) == 10000 * config["start_stack"]
+
+    stats = tournament.level_stats
+    assert [level["level"] for level in stats] == list(range(len(stats)))
+    players = [level["players"] for level in stats]
+    assert players == sorted(players, reverse=True)
+    assert stats[-1]["players"] == 1
+    assert stats[-1]["tables"] == 1
+    assert sum(level["rounds"] for level in stats) == tournament.rounds
+    assert all(level["seconds"] > 0 for level in stats)
+
+    with pytest.raises(error.TournamentResetError):
+        tournament.step()
+
+
+def test_balance() -> None:
+    random.seed(0)
+    tournament = clubs_gym.tournament.Tournament(
+        clubs.configs.NO_LIMIT_HOLDEM_SIX_PLAYER,
+        num_players=100,
+        agents=[PushFoldAgent() for _ in range(100)],
+        blind_schedule=[clubs_gym.tournament.BlindLevel(10, 20, 5)],
+        hands_per_level=1,
+    )
+
+    with pytest.raises(error.TournamentResetError):
+        tournament.step()
+
+    tournament.reset()
+    while not tournament.step():
+        num_tables = -(-tournament.num_remaining // 6)
+        table_sizes = [len(table.players) for table in tournament.tables]
+        assert len(table_sizes) == num_tables
+        assert max(table_sizes) - min(table_sizes) <= 1
+        assert sum(table_sizes) == tournament.num_remaining
+
+    assert len(tournament.level_stats) == 1
+    assert sum(tournament.stacks) == 100 * 200
+
+
+def test_sit_and_go() -> None:
+    random.seed(0)
+    tournament = clubs_gym.tournament.Tournament(
+        clubs.configs.NO_LIMIT_HOLDEM_SIX_PLAYER,
+        num_players=6,
+        agents=PushFoldAgent(),
+        blind_schedule=[(1, 2), (5, 10)],
+        hands_per_level=10,
+        start_stack=100,
+    )
+    tournament.reset()
+    assert len(tournament.tables) == 1
+
+    standings = tournament.run()
+    assert sorted(standings) == list(range(6))
+    assert tournament.stacks[standings[0]] == 600
+    assert standings[1:] == tournament.eliminated[::-1]
+
+
+def test_short_stack() -> None:
+    random.seed(0)
+    dealer = clubs_gym.tournament.tournament._TableDealer(
+        **clubs.configs.NO_LIMIT_HOLDEM_NINE_PLAYER
+    )
+    obs = dealer.seat([100, 100, 3], -1, clubs_gym.tournament.BlindLevel(2, 4, 1))
+
+    # the big blind posts its ante and the remaining 2 chips all in
+    assert dealer.stacks == [99, 97, 0]
+    assert dealer.street_commits == [0, 2, 2]
+    assert dealer.pot == 7
+    assert obs["call"] == 2
+
+    while True:
+        obs, payouts, done = dealer.step(obs["call"])
+        if all(done):
+            break
+
+    assert all(stack >= 0 for stack in dealer.stacks)
+    assert sum(dealer.stacks) == 203
+    # the short stack can win at most the main pot of 3 chips per player
+    assert dealer.stacks[2] in (0, 9)
+
+    # folding to a short big blind only loses the chips it could cover
+    obs = dealer.seat([100, 100, 11], -1, clubs_gym.tournament.BlindLevel(2, 20, 1))
+    assert dealer.stacks == [99, 97, 0]
+    assert obs["call"] == 10
+    while True:
+        obs, payouts, done = dealer.step(0)
+        if all(done):
+            break
+    assert dealer.stacks == [99, 97, 15]
+
+
+def test_errors() -> None:
+    config = clubs.configs.NO_LIMIT_HOLDEM_NINE_PLAYER
+    agent = PushFoldAgent()
+    with pytest.raises(error.InvalidTournamentConfigurationError):
+        clubs_gym.tournament.Tournament(config, 1, agent, [(1, 2)], 1)
+
+    with pytest.raises(error.InvalidTournamentConfigurationError):
+        clubs_gym.tournament.Tournament(config, 10, agent, [], 1)
+
+    with pytest.raises(error.InvalidTournamentConfigurationError):
+        clubs_gym.tournament.Tournament(config, 10, agent, [(1, 2)], 0)
+
+    with pytest.raises(error.InvalidTournamentConfigurationError):
+        clubs_gym.tournament.Tournament(config, 10, [agent] * 9, [(1, 2)], 1)
+
+    with pytest.raises(error.InvalidTournamentConfigurationError):
+        clubs_gym.tournament.Tournament(
+            config, 2, [agent, None], [(1, 2)], 1  # type: ignore
+        )
+
+    with pytest.raises(error.InvalidTournamentConfigurationError):
+        clubs_gym.tournament.Tournament(
+            {**config, "num_players": 1}, 2, agent, [(1, 2)], 1
+        )